@@ -0,0 +1,175 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from statistics import median
+from typing import Dict, List
+
+# Measure without opening a window unless a video driver is already set
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Runs main.py's own startup path and prints in-process phase timings
+COLD_START_CODE = """
+import time
+start = time.perf_counter()
+import pygame
+imported_pygame = time.perf_counter()
+import main
+imported_main = time.perf_counter()
+args = main.parse_args([])
+main.init_pygame()
+initialized = time.perf_counter()
+game = main.Game(render_backend=args.renderer)
+created = time.perf_counter()
+game.draw()
+drawn = time.perf_counter()
+print(imported_pygame - start, imported_main - imported_pygame,
+      initialized - imported_main, created - initialized, drawn - created)
+"""
+
+PHASES = [
+    "import pygame",
+    "import main/src",
+    "display+font init",
+    "Game()",
+    "first frame",
+]
+
+# Sub-imports of pygame worth reporting on their own
+IMPORTS = ["pygame.surfarray", "numpy", "pygame.pkgdata", "pkg_resources"]
+
+
+def measure_cold_start(runs: int) -> Dict[str, List[float]]:
+    """
+    Measure cold-start time in fresh interpreters.
+
+    The total is timed from the parent around the whole subprocess, so it
+    includes interpreter startup and shutdown. Each child runs main.py's
+    startup path up to the first frame and reports its phases in-process.
+
+    Args:
+        runs (int): Number of fresh interpreters to launch
+
+    Returns:
+        Dict[str, List[float]]: Times in seconds per phase
+    """
+    results: Dict[str, List[float]] = {name: [] for name in ["total", "in-process"]}
+    results.update({name: [] for name in PHASES})
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.check_output(
+            [sys.executable, "-c", COLD_START_CODE], cwd=ROOT, text=True
+        )
+        total = time.perf_counter() - start
+        phases = [float(value) for value in output.split()[-len(PHASES) :]]
+        results["total"].append(total)
+        results["in-process"].append(sum(phases))
+        for name, value in zip(PHASES, phases):
+            results[name].append(value)
+    results["interpreter"] = [
+        total - in_process
+        for total, in_process in zip(results["total"], results["in-process"])
+    ]
+    return results
+
+
+def measure_imports() -> Dict[str, float]:
+    """
+    Measure cumulative import time of selected pygame sub-imports.
+
+    Uses `python -X importtime`, which adds some overhead of its own.
+
+    Returns:
+        Dict[str, float]: Cumulative import time in seconds per module
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pygame"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in output.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)", line)
+        if match and match.group(2) in IMPORTS:
+            times[match.group(2)] = int(match.group(1)) / 1e6
+    return times
+
+
+def measure_restart(runs: int) -> List[float]:
+    """
+    Measure the latency of Game.restart_game followed by the next frame.
+
+    Args:
+        runs (int): Number of restarts to time
+
+    Returns:
+        List[float]: Restart latencies in seconds
+    """
+    import pygame
+
+    import main as tetris
+
+    tetris.init_pygame()
+    game = tetris.Game()
+    times = []
+    for _ in range(runs):
+        game.board.game_over = True
+        start = time.perf_counter()
+        game.restart_game()
+        game.draw()
+        times.append(time.perf_counter() - start)
+    pygame.quit()
+    return times
+
+
+def _report(name: str, times: List[float]) -> None:
+    """
+    Print one report line with the min, median and max of the times.
+
+    Args:
+        name (str): Label of the line
+        times (List[float]): Times in seconds
+    """
+    print(
+        f"  {name:<28} "
+        f"min={min(times) * 1000:8.2f} ms  "
+        f"median={median(times) * 1000:8.2f} ms  "
+        f"max={max(times) * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    """
+    Print a cold-start and restart-latency report.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.strip())
+    parser.add_argument("--cold-runs", type=int, default=10)
+    parser.add_argument("--restart-runs", type=int, default=200)
+    args = parser.parse_args()
+
+    cold = measure_cold_start(args.cold_runs)
+    print(
+        f"Cold start, process spawn to exit after first frame ({args.cold_runs} runs)"
+    )
+    _report("total", cold["total"])
+    _report("interpreter startup/exit", cold["interpreter"])
+    for name in PHASES:
+        _report(name, cold[name])
+
+    print("Import breakdown of `import pygame` (-X importtime, cumulative)")
+    for name, value in measure_imports().items():
+        print(f"  {name:<28} {value * 1000:8.2f} ms")
+
+    print(f"Restart, restart_game plus next frame ({args.restart_runs} runs)")
+    _report("restart", measure_restart(args.restart_runs))
+
+
+if __name__ == "__main__":
+    main()
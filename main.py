@@ -1,17 +1,62 @@
+import argparse
+from typing import List, Optional
+
 import pygame
 
+from src.constants import RENDER_BACKEND, RENDER_BACKENDS
 from src.game import Game
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse, defaults to sys.argv
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Tetris game developed using Pygame")
+    parser.add_argument(
+        "--renderer",
+        choices=RENDER_BACKENDS,
+        default=RENDER_BACKEND,
+        help="board render backend (surfarray requires NumPy)",
+    )
+    args = parser.parse_args(argv)
+    if args.renderer == "surfarray":
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            parser.error(
+                "--renderer surfarray requires NumPy; install it with "
+                "'pip install numpy'"
+            )
+    return args
+
+
+def init_pygame() -> None:
+    """
+    Initialize only the pygame modules in use: display and font.
+
+    Note that `import pygame` itself still imports pygame.surfarray (and
+    NumPy, when installed) and pygame.pkgdata; that is outside our control.
+    """
+    pygame.display.init()
+    pygame.font.init()
+
+
 def main() -> None:
     """
     Main entry point for the Tetris game.
 
-    Initializes pygame, creates a game instance, runs the game loop,
-    and performs cleanup when the game exits.
+    Parses arguments, initializes the pygame modules in use, creates a game
+    instance, runs the game loop, and performs cleanup when the game exits.
     """
-    pygame.init()
-    game = Game()
+    args = parse_args()
+    init_pygame()
+    game = Game(render_backend=args.renderer)
     game.run()
     pygame.quit()
 
@@ -9,6 +9,10 @@ WALL_SIZE = BLOCK_SIZE  # Size of the border walls
 WINDOW_WIDTH = (GRID_WIDTH + 2) * BLOCK_SIZE  # +2 for walls
 WINDOW_HEIGHT = (GRID_HEIGHT + 2) * BLOCK_SIZE  # +2 for walls
 
+# Rendering
+RENDER_BACKENDS = ("draw", "surfarray")  # "surfarray" requires NumPy
+RENDER_BACKEND = "draw"  # Default board render backend
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
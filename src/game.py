@@ -1,10 +1,13 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
 from .board import Board
 from .constants import *
 
+if TYPE_CHECKING:
+    from .renderer import SurfarrayRenderer
+
 
 class Game:
     """
@@ -14,12 +17,33 @@ class Game:
     level progression, and game loop execution.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, render_backend: str = RENDER_BACKEND) -> None:
         """
         Initialize a new game instance.
+
+        Args:
+            render_backend (str): Board render backend, one of RENDER_BACKENDS
         """
-        self.screen: pygame.Surface
-        self.clock: pygame.time.Clock
+        if render_backend not in RENDER_BACKENDS:
+            raise ValueError(f"Unknown render backend: {render_backend!r}")
+
+        self.render_backend: str = render_backend
+        self.renderer: Optional["SurfarrayRenderer"] = None
+        if render_backend == "surfarray":
+            from .renderer import SurfarrayRenderer
+
+            self.renderer = SurfarrayRenderer()
+
+        self.screen: pygame.Surface = pygame.display.set_mode(
+            (WINDOW_WIDTH, WINDOW_HEIGHT)
+        )
+        pygame.display.set_caption("Pygame Tetris")
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.font: pygame.font.Font = pygame.font.Font(None, 36)
+        self.overlay: pygame.Surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.overlay.fill(BLACK)
+        self.overlay.set_alpha(128)
+
         self.board: Board
         self.score: int
         self.level: int
@@ -34,11 +58,9 @@ class Game:
         """
         Initialize or reset all game variables to their starting values.
 
-        Sets up the display, clock, board, and game state variables.
+        Sets up a fresh board and game state variables. The display, clock,
+        font and other surfaces are created once in __init__ and reused.
         """
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Pygame Tetris")
-        self.clock = pygame.time.Clock()
         self.board = Board()
         self.score = 0
         self.level = 1
@@ -50,7 +72,7 @@ class Game:
 
     def restart_game(self) -> None:
         """
-        Restart the game by reinitializing all game variables.
+        Restart the game by resetting the game state, reusing the display.
         """
         self.init_game()
 
@@ -149,7 +171,8 @@ class Game:
         """
         self.screen.fill(BLACK)
         self._draw_grid()
-        self._draw_pieces()
+        if not (self.renderer and self.renderer.draw_pieces(self.screen, self.board)):
+            self._draw_pieces()
         self._draw_ui()
         pygame.display.flip()
 
@@ -246,17 +269,14 @@ class Game:
         """
         Draw UI elements including score, level, and game over screen.
         """
-        font = pygame.font.Font(None, 36)
+        font = self.font
         score_text = font.render(f"Score: {self.score}", True, WHITE)
         level_text = font.render(f"Level: {self.level}", True, WHITE)
         self.screen.blit(score_text, (WINDOW_WIDTH - 200, 20))
         self.screen.blit(level_text, (WINDOW_WIDTH - 200, 60))
 
         if self.board.game_over:
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.fill(BLACK)
-            overlay.set_alpha(128)
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.overlay, (0, 0))
 
             game_over_text = font.render("GAME OVER", True, RED)
             restart_text = font.render("Press R to Restart", True, WHITE)
@@ -0,0 +1,125 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from .board import Board
+from .constants import *
+from .tetromino import Tetromino
+
+
+class SurfarrayRenderer:
+    """
+    Alternative render backend that rasterizes the whole board in one pass.
+
+    The board is mapped to a small index image (one palette index per cell),
+    scaled up to pixel resolution with a precomputed block tile through NumPy,
+    and blitted to the screen once. The output is pixel-identical to
+    Game._draw_pieces, including the 1px block borders.
+    """
+
+    def __init__(self) -> None:
+        """
+        Build the palette, the block border mask and the indexed play surface.
+        """
+        # Index 0 is the empty cell and the border colour, both black. The
+        # palette is fixed to the tetromino colors so indices always fit a byte.
+        self.palette: List[Tuple[int, int, int]] = [BLACK] + [
+            data.color for data in Tetromino.SHAPES.values()
+        ]
+        self.color_index: Dict[Optional[Tuple[int, int, int]], int] = {
+            color: index for index, color in enumerate(self.palette)
+        }
+        self.color_index[None] = 0
+
+        # Block tile: True on the 1px outline drawn by pygame.draw.rect(..., 1)
+        tile = np.zeros((BLOCK_SIZE, BLOCK_SIZE), dtype=bool)
+        tile[:BORDER_WIDTH, :] = True
+        tile[-BORDER_WIDTH:, :] = True
+        tile[:, :BORDER_WIDTH] = True
+        tile[:, -BORDER_WIDTH:] = True
+        self.border_mask: np.ndarray = np.tile(tile, (GRID_WIDTH, GRID_HEIGHT))
+
+        self.surface: pygame.Surface = pygame.Surface(
+            (GRID_WIDTH * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE), depth=8
+        )
+        self.surface.set_palette(self.palette)
+
+    def _index_grid(self, board: Board) -> Optional[np.ndarray]:
+        """
+        Map the fallen pieces and the in-grid cells of the active piece to an
+        index image.
+
+        Args:
+            board (Board): The board to map
+
+        Returns:
+            Optional[np.ndarray]: Array of shape (GRID_WIDTH, GRID_HEIGHT) of
+                palette indices, or None if the board holds a color outside
+                the palette
+        """
+        color_index = self.color_index
+        try:
+            indices = np.array(
+                [[color_index[color] for color in row] for row in board.grid],
+                dtype=np.uint8,
+            ).T
+        except KeyError:
+            return None
+
+        piece: Optional[Tetromino] = board.current_piece
+        if piece:
+            piece_index = color_index.get(piece.color)
+            if piece_index is None:
+                return None
+            for y, row in enumerate(piece.shape):
+                for x, cell in enumerate(row):
+                    abs_x = piece.x + x
+                    abs_y = piece.y + y
+                    if cell and 0 <= abs_x < GRID_WIDTH and 0 <= abs_y < GRID_HEIGHT:
+                        indices[abs_x, abs_y] = piece_index
+        return indices
+
+    def draw_pieces(self, screen: pygame.Surface, board: Board) -> bool:
+        """
+        Draw all pieces on the board, including fallen pieces and the active piece.
+
+        Cells of the active piece outside the grid are drawn over the walls
+        with pygame.draw.rect, as Game._draw_pieces does.
+
+        Args:
+            screen (pygame.Surface): The surface to draw onto
+            board (Board): The board to render
+
+        Returns:
+            bool: False if the board holds a color outside the palette, in
+                which case nothing is drawn and the caller should fall back
+                to Game._draw_pieces
+        """
+        indices = self._index_grid(board)
+        if indices is None:
+            return False
+
+        pixels = indices.repeat(BLOCK_SIZE, axis=0).repeat(BLOCK_SIZE, axis=1)
+        pixels[self.border_mask] = 0
+        pygame.surfarray.blit_array(self.surface, pixels)
+        screen.blit(self.surface, (WALL_SIZE, WALL_SIZE))
+
+        piece = board.current_piece
+        if piece:
+            for y, row in enumerate(piece.shape):
+                for x, cell in enumerate(row):
+                    abs_x = piece.x + x
+                    abs_y = piece.y + y
+                    if cell and not (
+                        0 <= abs_x < GRID_WIDTH and 0 <= abs_y < GRID_HEIGHT
+                    ):
+                        rect = (
+                            (abs_x + 1) * BLOCK_SIZE,
+                            (abs_y + 1) * BLOCK_SIZE,
+                            BLOCK_SIZE,
+                            BLOCK_SIZE,
+                        )
+                        pygame.draw.rect(screen, piece.color, rect)
+                        pygame.draw.rect(screen, BLACK, rect, 1)
+        return True
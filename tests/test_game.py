@@ -28,6 +28,18 @@ def test_game_initialization(game: Game) -> None:
     assert hasattr(game, "clock")
 
 
+def test_default_render_backend(game: Game) -> None:
+    """Test that the default backend draws per cell without a renderer."""
+    assert game.render_backend == "draw"
+    assert game.renderer is None
+
+
+def test_unknown_render_backend() -> None:
+    """Test that an unknown render backend is rejected."""
+    with pytest.raises(ValueError):
+        Game(render_backend="opengl")
+
+
 def test_game_restart(game: Game) -> None:
     """Test game restart functionality."""
     # Modify game state
@@ -44,6 +56,21 @@ def test_game_restart(game: Game) -> None:
     assert game.paused is False
 
 
+def test_game_restart_reuses_display(game: Game) -> None:
+    """Test that restarting resets game state but keeps display resources."""
+    screen, clock, font = game.screen, game.clock, game.font
+    board = game.board
+
+    with patch("pygame.display.set_mode") as mock_set_mode:
+        game.restart_game()
+
+    mock_set_mode.assert_not_called()
+    assert game.screen is screen
+    assert game.clock is clock
+    assert game.font is font
+    assert game.board is not board
+
+
 @pytest.mark.parametrize(
     "lines_cleared,expected_score",
     [
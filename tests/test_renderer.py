@@ -0,0 +1,74 @@
+import random
+from typing import Tuple
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.constants import GRID_HEIGHT, GRID_WIDTH, WHITE
+from src.game import Game
+from src.tetromino import Tetromino
+
+
+@pytest.fixture
+def game() -> Game:
+    """Fixture providing a Game instance using the surfarray render backend."""
+    pygame.init()
+    game = Game(render_backend="surfarray")
+    yield game
+    pygame.quit()
+
+
+def _render_both(game: Game) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Render a frame with both backends and return the two screen buffers."""
+    renderer = game.renderer
+    game.renderer = None
+    game.draw()
+    expected = pygame.surfarray.array3d(game.screen)
+
+    game.renderer = renderer
+    game.draw()
+    actual = pygame.surfarray.array3d(game.screen)
+    return expected, actual
+
+
+def test_surfarray_matches_draw_on_empty_board(game: Game) -> None:
+    """Test that an empty board with an active piece renders identically."""
+    expected, actual = _render_both(game)
+    assert np.array_equal(actual, expected)
+
+
+def test_surfarray_matches_draw_on_filled_board(game: Game) -> None:
+    """Test that a randomly filled board renders identically."""
+    rng = random.Random(0)
+    colors = [data.color for data in Tetromino.SHAPES.values()]
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            if rng.random() < 0.5:
+                game.board.grid[y][x] = rng.choice(colors)
+    for _ in range(2):
+        game.board.current_piece.rotate()
+
+    expected, actual = _render_both(game)
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("x,y", [(3, -1), (-1, 5), (GRID_WIDTH - 1, 5)])
+def test_surfarray_matches_draw_outside_grid(game: Game, x: int, y: int) -> None:
+    """Test that active piece cells outside the grid are drawn over the walls."""
+    game.board.current_piece.x = x
+    game.board.current_piece.y = y
+    expected, actual = _render_both(game)
+    assert np.array_equal(actual, expected)
+
+
+def test_surfarray_falls_back_on_unknown_colors(game: Game) -> None:
+    """Test that colors outside the palette fall back to per-cell drawing."""
+    for i in range(300):
+        game.board.grid[0][0] = (i % 256, i // 256, 7)
+        assert game.renderer.draw_pieces(game.screen, game.board) is False
+
+    game.board.grid[GRID_HEIGHT - 1][0] = WHITE
+    expected, actual = _render_both(game)
+    assert np.array_equal(actual, expected)